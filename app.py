@@ -9,8 +9,10 @@ and chat session management.
 """
 
 # imports built-in modules
+import hashlib
 import re
 import shutil
+import ssl
 from pathlib import Path
 from typing import Any, Optional
 
@@ -28,6 +30,10 @@ from src.utils.logger import get_app_logger
 # Application logger
 logger = get_app_logger()
 
+# hashlib digests go through this libcrypto; 3.0+ picks SHA-NI when available
+logger.info(f"Using {ssl.OPENSSL_VERSION}")
+logger.info(f"hashlib algorithms: {', '.join(sorted(hashlib.algorithms_available))}")
+
 
 @cl.set_chat_profiles
 async def chat_profile(current_user: cl.User | None, current_chat_profile: str | None):
@@ -44,13 +50,14 @@ async def chat_profile(current_user: cl.User | None, current_chat_profile: str |
     # Get database connection pool
     pool = await get_pool()
     async with pool.acquire() as conn:
-        sessions = await ChatSession.list_by_user(conn, user_id)
+        # Show 5 most recent chats
+        sessions = await ChatSession.list_by_user(conn, user_id, limit=5)
 
         profiles = []
 
         # List user's most recent chats
         title_counts: dict[str, int] = {}
-        for idx, session in enumerate(sessions[:5]):  # Show 5 most recent
+        for idx, session in enumerate(sessions):
             title = session["title"]
             if title in title_counts:
                 title_counts[title] += 1
@@ -260,7 +267,7 @@ async def load_or_create_chat():
 
     pool = await get_pool()
     async with pool.acquire() as conn:
-        sessions = await ChatSession.list_by_user(conn, user_id)
+        sessions = await ChatSession.list_by_user(conn, user_id, limit=1)
 
         if sessions:
             # Load the most recent chat
@@ -315,7 +322,7 @@ async def show_chat_management():
 
     pool = await get_pool()
     async with pool.acquire() as conn:
-        sessions = await ChatSession.list_by_user(conn, user_id)
+        sessions = await ChatSession.list_by_user(conn, user_id, limit=10)
 
         if not sessions:
             await cl.Message(
@@ -334,7 +341,7 @@ async def show_chat_management():
         management_msgs.append(header_msg)
 
         # Send each chat as a separate message with its own action buttons
-        for i, session in enumerate(sessions[:10], 1):
+        for i, session in enumerate(sessions, 1):
             chat_info = f"**{i}. {session['title']}**\n📅 {session['updated_at'].strftime('%Y-%m-%d %H:%M')}"
 
             # Create action buttons for this specific chat
@@ -380,11 +387,11 @@ async def load_chat_by_profile_name(profile_name: str):
 
     pool = await get_pool()
     async with pool.acquire() as conn:
-        sessions = await ChatSession.list_by_user(conn, user_id)
+        sessions = await ChatSession.list_by_user(conn, user_id, limit=5)
 
         # Build same mapping as in chat_profile to find matching session
         title_counts: dict[str, int] = {}
-        for session in sessions[:5]:
+        for session in sessions:
             title = session["title"]
             if title in title_counts:
                 title_counts[title] += 1
@@ -601,7 +608,7 @@ async def process_uploaded_file(file):
         gemini_file = await rag_manager.upload_file(
             str(file_path), display_name=file.name
         )
-        rag_manager.wait_for_files_active([gemini_file])
+        await rag_manager.wait_for_files_active([gemini_file])
 
         # Save document to database and update chat title to file name
         pool = await get_pool()
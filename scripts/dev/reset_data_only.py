@@ -6,16 +6,19 @@ WARNING: This will delete ALL data from the database!
 Only use in development environments.
 
 Usage:
-    python scripts/dev/reset_data_only.py
+    python scripts/dev/reset_data_only.py [--yes]
 """
 
+import argparse
 import asyncio
+import os
 import sys
-from pathlib import Path
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.insert(0, PROJECT_ROOT)
 
 from src.db import get_pool
 from src.utils.logger import get_db_logger
@@ -26,16 +29,13 @@ logger = get_db_logger()
 
 async def reset_data_only():
     """Reset data but keep schema - safe for development."""
-    logger.warning("⚠️ This will delete ALL data from the database!")
-    confirm = input("Are you sure? (type 'yes' to confirm): ").strip().lower()
-
-    if confirm != "yes":
-        logger.info("❌ Operation aborted by user.")
-        return
-
     pool = await get_pool()
     async with pool.acquire() as conn:
-        # Truncate tables (faster than DELETE, resets sequences automatically)
+        # Truncate tables (faster than DELETE, resets sequences automatically).
+        # All four tables go in one statement, so PostgreSQL truncates them
+        # together without firing the per-row FK triggers a DELETE would;
+        # switching session_replication_role would gain nothing and needs
+        # superuser rights the application user does not have.
         await conn.execute(
             "TRUNCATE users, chat_sessions, messages, documents RESTART IDENTITY CASCADE"
         )
@@ -43,4 +43,18 @@ async def reset_data_only():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reset all data but keep schema.")
+    parser.add_argument(
+        "-y", "--yes", action="store_true", help="skip the confirmation prompt"
+    )
+    args = parser.parse_args()
+
+    # Confirm before starting the event loop so input() never blocks it
+    logger.warning("⚠️ This will delete ALL data from the database!")
+    if not args.yes:
+        confirm = input("Are you sure? (type 'yes' to confirm): ").strip().lower()
+        if confirm != "yes":
+            logger.info("❌ Operation aborted by user.")
+            sys.exit(0)
+
     asyncio.run(reset_data_only())
@@ -1,26 +1,32 @@
 # scripts/dev/reset_logs_files.py
 """
-Script to delete all log files (*.log) from the logs folder.
+Script to delete all log files, including rotated ones, from the logs folder.
 
 WARNING: This will permanently delete log data.
 
 Usage:
-    python scripts/dev/reset_logs_files.py
+    python scripts/dev/reset_logs_files.py [--yes]
 """
 
 # imports built-in modules
+import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
+# Project root, computed once at import time
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
 
-def main():
+
+def main(assume_yes: bool = False):
     """
-    Set up paths, validate config, and delete all .log files in the logs folder.
+    Set up paths, validate config, and delete all log files in the logs folder.
     """
     # Add project root to path to allow local imports
-    project_root = Path(__file__).parent.parent.parent
-    sys.path.insert(0, str(project_root))
+    sys.path.insert(0, PROJECT_ROOT)
 
     # Local imports are here to avoid ruff E402
     from src.config import config  # noqa: E402
@@ -34,21 +40,25 @@ def main():
 
     logs_dir = Path(config.LOGS_DIR)
 
-    logger.warning(f"⚠️ This will delete all *.log files in the '{logs_dir}' folder!")
-    confirm = input("Are you sure? (type 'yes' to confirm): ").strip().lower()
-
-    if confirm != "yes":
-        logger.info("❌ Operation aborted by user.")
-        return
+    logger.warning(f"⚠️ This will delete all log files in the '{logs_dir}' folder!")
+    if not assume_yes:
+        confirm = input("Are you sure? (type 'yes' to confirm): ").strip().lower()
+        if confirm != "yes":
+            logger.info("❌ Operation aborted by user.")
+            return
 
     if not logs_dir.is_dir():
         logger.info(f"ℹ️ The logs directory '{logs_dir}' does not exist. Nothing to do.")
         return
 
     log_files_deleted = 0
-    for log_file in logs_dir.glob("*.log"):
-        log_file.unlink()
-        log_files_deleted += 1
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            # Rotated files keep the date after the extension: db.log.2025-01-31
+            is_log = entry.name.endswith(".log") or ".log." in entry.name
+            if is_log and entry.is_file():
+                os.unlink(entry.path)
+                log_files_deleted += 1
 
     logger.info(
         f"✅ Successfully deleted {log_files_deleted} log file(s) from '{logs_dir}'."
@@ -56,4 +66,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Delete all log files.")
+    parser.add_argument(
+        "-y", "--yes", action="store_true", help="skip the confirmation prompt"
+    )
+    main(assume_yes=parser.parse_args().yes)
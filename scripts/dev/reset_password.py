@@ -12,12 +12,14 @@ Usage:
 """
 
 import asyncio
+import os
 import sys
-from pathlib import Path
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.insert(0, PROJECT_ROOT)
 
 from src.db.models import User
 from src.db.connection import get_pool
@@ -5,22 +5,37 @@ Script to delete the public folder for testing and debugging purposes.
 WARNING: Use with caution in production!
 
 Usage:
-    python scripts/dev/reset_upload_files.py
+    python scripts/dev/reset_upload_files.py [--yes]
 """
 
 # imports built-in modules
+import argparse
+import os
 import shutil
+import stat
 import sys
 from pathlib import Path
 
+# Project root, computed once at import time
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
 
-def main():
+
+def _remove_readonly(func, path, exc):
+    """Clear the read-only flag and retry, for files Windows refuses to delete."""
+    if not isinstance(exc, PermissionError):
+        raise exc
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def main(assume_yes: bool = False):
     """
     Set up paths, validate config, and reset the public folder.
     """
     # Add project root to path to allow local imports
-    project_root = Path(__file__).parent.parent.parent
-    sys.path.insert(0, str(project_root))
+    sys.path.insert(0, PROJECT_ROOT)
 
     # Local module imports(avoid ruff E402 error)
     from src.config import config
@@ -36,18 +51,23 @@ def main():
     public_dir = Path(config.PUBLIC_DIR)
 
     logger.warning(f"⚠️ This will delete the '{public_dir}' folder!")
-    confirm = input("Are you sure? (type 'yes' to confirm): ").strip().lower()
-
-    if confirm != "yes":
-        logger.info("❌ Operation aborted by user.")
-        return
+    if not assume_yes:
+        confirm = input("Are you sure? (type 'yes' to confirm): ").strip().lower()
+        if confirm != "yes":
+            logger.info("❌ Operation aborted by user.")
+            return
 
     if public_dir.exists():
-        shutil.rmtree(public_dir)
+        # rmtree uses the fd-based walk on POSIX; onexc handles read-only files
+        shutil.rmtree(public_dir, onexc=_remove_readonly)
         logger.info(f"✅ Successfully deleted the '{public_dir}' folder.")
     else:
         logger.info(f"ℹ️ The '{public_dir}' folder does not exist. Nothing to do.")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Delete the public folder.")
+    parser.add_argument(
+        "-y", "--yes", action="store_true", help="skip the confirmation prompt"
+    )
+    main(assume_yes=parser.parse_args().yes)
@@ -6,22 +6,26 @@ Run this script as postgres superuser before running setup_db.py.
 Usage:
     python scripts/grant_permissions.py
 
-This script will prompt for postgres password and grant all necessary
-permissions to gemini_user on the public schema.
+This script connects as the postgres superuser and grants all necessary
+permissions to gemini_user on the public schema. The superuser connection
+is taken from POSTGRES_ADMIN_URL if set, otherwise from DB_URL with the
+user replaced by postgres. If no valid password is found in the URL,
+PGPASSWORD or ~/.pgpass, the script prompts for the postgres password.
 """
 
 # imports built-in modules
+import asyncio
 import os
-import subprocess
 import sys
-from pathlib import Path
+from getpass import getpass
 from urllib.parse import urlparse
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
 
 # imports third-party modules
+import asyncpg
 from dotenv import load_dotenv
 
 from src.utils.logger import get_db_logger
@@ -64,7 +68,36 @@ def get_username_from_url() -> str:
         return "gemini_user"
 
 
-def main():
+def get_admin_url() -> str:
+    """Build the superuser connection URL.
+
+    Uses POSTGRES_ADMIN_URL when set, otherwise DB_URL with the user
+    replaced by ``postgres`` and the password removed.
+    """
+    admin_url = os.getenv("POSTGRES_ADMIN_URL")
+    if admin_url:
+        return admin_url
+
+    parsed_url = urlparse(os.getenv("DB_URL", ""))
+    host = parsed_url.hostname or "localhost"
+    port = f":{parsed_url.port}" if parsed_url.port else ""
+    return f"postgresql://postgres@{host}{port}/{get_db_name_from_url()}"
+
+
+async def connect_as_admin() -> asyncpg.Connection:
+    """Connect as the postgres superuser, prompting for a password if needed."""
+    admin_url = get_admin_url()
+    try:
+        return await asyncpg.connect(admin_url)
+    except asyncpg.InvalidPasswordError:
+        if not sys.stdin.isatty():
+            raise
+
+    password = getpass("Enter postgres password: ")
+    return await asyncpg.connect(admin_url, password=password)
+
+
+async def main():
     """Main function to grant permissions."""
     logger.info("🛠️ PostgreSQL Schema Permission Grant Tool")
     logger.info("=" * 50)
@@ -80,43 +113,31 @@ def main():
     # Build the SQL with actual username
     sql = GRANT_SQL.replace("gemini_user", db_user)
 
-    # Build psql command
-    cmd = [
-        "psql",
-        "-U",
-        "postgres",
-        "-d",
-        db_name,
-        "-c",
-        sql.strip().replace("\n", " "),
-    ]
-
     logger.info("Running grant commands...")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-
-        if result.returncode == 0:
-            logger.info("✅ Permissions granted successfully!")
-            logger.info(f"Output: {result.stdout}")
-            logger.info("You can now run: python scripts/setup_db.py")
-        else:
-            logger.error("❌ Error granting permissions:")
-            logger.error(result.stderr)
-            logger.info("You may need to run the following command manually:")
-            logger.info(
-                f'psql -U postgres -d {db_name} -c "{sql.strip().replace(chr(10), " ")}"'
-            )
-            sys.exit(1)
-
-    except FileNotFoundError:
-        logger.error("❌ psql command not found.")
-        logger.info("Make sure PostgreSQL is installed and psql is in your PATH.")
-        logger.info("Run the following command manually in psql:")
-        logger.info(f"# Connect to database: psql -U postgres -d {db_name}")
-        logger.info(f"# Then run: {sql}")
+        conn = await connect_as_admin()
+    except (OSError, asyncpg.PostgresError) as e:
+        logger.error(f"❌ Could not connect as postgres superuser: {e}")
+        logger.info("Set POSTGRES_ADMIN_URL or PGPASSWORD and try again.")
+        logger.info("Or run the following command manually:")
+        logger.info(
+            f'psql -U postgres -d {db_name} -c "{sql.strip().replace(chr(10), " ")}"'
+        )
+        sys.exit(1)
+
+    try:
+        # All statements are sent in one round-trip and applied atomically
+        async with conn.transaction():
+            await conn.execute(sql)
+        logger.info("✅ Permissions granted successfully!")
+        logger.info("You can now run: python scripts/setup_db.py")
+    except asyncpg.PostgresError as e:
+        logger.error(f"❌ Error granting permissions: {e}")
         sys.exit(1)
+    finally:
+        await conn.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
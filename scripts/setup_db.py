@@ -9,38 +9,49 @@ Usage:
 
 # imports built-in modules
 import asyncio
+import os
 import sys
-from pathlib import Path
+from typing import Optional, Tuple
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
 
-# imports local modules
-from src.db import User
-from src.db.connection import close_pool, get_pool, init_database
-from src.utils.logger import get_db_logger
+# Project modules load asyncpg, argon2 and the Gemini SDK, so they are
+# imported inside the functions below, once the prompts have been answered
 
-# Database logger
-logger = get_db_logger()
 
+def prompt_admin_user() -> Optional[Tuple[str, str, str]]:
+    """Ask for the admin user's details.
 
-async def create_admin_user():
-    """Create an admin user interactively."""
-    logger.info("=== Create Admin User ===")
+    Returns
+    -------
+    Optional[Tuple[str, str, str]]
+        ``(username, email, password)``, or None if the input is invalid.
+    """
+    print("=== Create Admin User ===")
     username = input("Enter admin username: ").strip()
     email = input("Enter admin email: ").strip()
     password = input("Enter admin password: ").strip()
     password_confirm = input("Confirm password: ").strip()
 
     if password != password_confirm:
-        logger.error("❌ Passwords do not match!")
-        return False
+        print("❌ Passwords do not match!")
+        return None
 
     if not username or not email or not password:
-        logger.error("❌ All fields are required!")
-        return False
+        print("❌ All fields are required!")
+        return None
 
+    return username, email, password
+
+
+async def create_admin_user(username: str, email: str, password: str) -> bool:
+    """Create the admin user."""
+    from src.db import User, get_pool
+    from src.utils.logger import get_db_logger
+
+    logger = get_db_logger()
     pool = await get_pool()
     async with pool.acquire() as conn:
         user_id = await User.create(conn, username, email, password)
@@ -57,24 +68,25 @@ async def create_admin_user():
 
 async def main():
     """Main setup function."""
+    # Ask if user wants to create admin account
+    create_admin = input("Do you want to create an admin user? (y/n): ").strip().lower()
+    admin = prompt_admin_user() if create_admin == "y" else None
+
+    from src.db import close_pool, init_database
+    from src.utils.logger import get_db_logger
+
+    logger = get_db_logger()
     logger.info("🛠️ Starting database setup...")
 
     try:
         # Initialize database schema
         await init_database()
 
-        # Ask if user wants to create admin account
-        create_admin = (
-            input("\nDo you want to create an admin user? (y/n): ").strip().lower()
-        )
-
-        if create_admin == "y":
-            await create_admin_user()
+        if admin:
+            await create_admin_user(*admin)
 
         logger.info("✅ Database setup complete!")
-        logger.info(
-            "You can now run the application with: chainlit run app_multiuser.py -w"
-        )
+        logger.info("You can now run the application with: chainlit run app.py -w")
 
     except Exception as e:
         logger.error(f"❌ Error during setup: {e}")
@@ -42,20 +42,21 @@ async def auth_callback(username: str, password: str) -> Optional[cl.User]:
             },
         )
 
+    # The pool checks a connection out only for the lookup query, so none
+    # is held while the password hash is being verified
     pool = await get_pool()
-    async with pool.acquire() as conn:
-        user_data = await User.authenticate(conn, username, password)
+    user_data = await User.authenticate(pool, username, password)
 
-        if user_data:
-            return cl.User(
-                identifier=user_data["username"],
-                metadata={
-                    "username": user_data["username"],
-                    "email": user_data["email"],
-                    "user_id": user_data["id"],
-                },
-            )
-        return None
+    if user_data:
+        return cl.User(
+            identifier=user_data["username"],
+            metadata={
+                "username": user_data["username"],
+                "email": user_data["email"],
+                "user_id": user_data["id"],
+            },
+        )
+    return None
 
 
 async def register_user(username: str, email: str, password: str) -> Optional[int]:
@@ -75,9 +76,9 @@ async def register_user(username: str, email: str, password: str) -> Optional[in
     Optional[int]
         User ID if registration successful, None if username/email already exists.
     """
+    # As in auth_callback, no connection is held while the password is hashed
     pool = await get_pool()
-    async with pool.acquire() as conn:
-        return await User.create(conn, username, email, password)
+    return await User.create(pool, username, email, password)
 
 
 def get_current_user_id() -> Optional[int]:
@@ -30,6 +30,10 @@ class Config:
 
     # Database
     DB_URL: Optional[str] = os.getenv("DB_URL")
+    DB_POOL_MIN_SIZE: int = int(os.getenv("DB_POOL_MIN_SIZE", "5"))
+    DB_POOL_MAX_SIZE: int = int(os.getenv("DB_POOL_MAX_SIZE", "20"))
+    DB_COMMAND_TIMEOUT: float = float(os.getenv("DB_COMMAND_TIMEOUT", "30"))
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
 
     # Gemini Model Configuration
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
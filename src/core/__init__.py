@@ -7,9 +7,15 @@ Contains RAG manager, chat handling, and file processing logic.
 
 from src.core.rag_manager import (
     create_chat_session,
+    upload_and_wait_all,
     upload_file,
     wait_for_files_active,
 )
 
-__all__ = ["upload_file", "wait_for_files_active", "create_chat_session"]
+__all__ = [
+    "upload_file",
+    "wait_for_files_active",
+    "upload_and_wait_all",
+    "create_chat_session",
+]
 
@@ -7,10 +7,12 @@ with the Google Gemini API.
 """
 
 # imports built-in modules
+import asyncio
+import hashlib
+import mimetypes
 import os
-import shutil
-import time
-import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 # imports third-party modules
@@ -27,8 +29,23 @@ logger = get_app_logger()
 # Create the Gemini client with API key
 client = genai.Client(api_key=config.GOOGLE_API_KEY)
 
-# Configuration for the model
-generation_config = types.GenerateContentConfig(
+# System instruction given to every chat session
+SYSTEM_INSTRUCTION = """You are a helpful assistant. You have access to the provided files.
+
+**Language rule**: Detect the primary language of the document and respond entirely in that language. Do not translate content.
+
+**Task 1 – Summary**
+Summarize the file concisely and clearly, covering the main topics and key findings.
+When referencing a specific fact or section, cite the page inline using the format (p. X), where X is the page number.
+
+**Task 2 – Key Takeaways Q&A**
+End with a Q&A section of the most important takeaways from the document, in the same language as the document.
+
+Format the entire response in clean Markdown (headings, bullet points, bold) for readability."""
+
+# Configuration for the model, shared by all chat sessions
+GENERATION_CONFIG = types.GenerateContentConfig(
+    system_instruction=SYSTEM_INSTRUCTION,
     temperature=config.GEMINI_TEMPERATURE,
     top_p=config.GEMINI_TOP_P,
     top_k=config.GEMINI_TOP_K,
@@ -36,43 +53,155 @@ generation_config = types.GenerateContentConfig(
     response_mime_type="text/plain",
 )
 
+# Delay between file state polls, doubled after each poll up to the maximum
+_POLL_INITIAL_DELAY = 0.25
+_POLL_MAX_DELAY = 2.0
+
+# Uploaded files keyed by content digest, so identical files are not re-uploaded
+_UPLOAD_CACHE_SIZE = 256
+_UPLOAD_CACHE_EXPIRY_MARGIN = timedelta(hours=1)
+_upload_cache: "OrderedDict[str, types.File]" = OrderedDict()
+
+# Read buffer for file uploads
+_UPLOAD_BUFFER_SIZE = 1 << 20
+
+
+def _file_digest(file_path: str) -> str:
+    """Return the BLAKE2b hex digest of a file's content."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
+
+
+def _get_cached_upload(digest: str) -> Optional[types.File]:
+    """Return a previously uploaded file for a digest if it is still usable.
+
+    Gemini deletes uploaded files after a while, so entries that expire
+    within :data:`_UPLOAD_CACHE_EXPIRY_MARGIN` are evicted instead.
+    """
+    cached = _upload_cache.get(digest)
+    if cached is None:
+        return None
+
+    expires = cached.expiration_time
+    if expires and expires - _UPLOAD_CACHE_EXPIRY_MARGIN <= datetime.now(timezone.utc):
+        del _upload_cache[digest]
+        return None
+
+    _upload_cache.move_to_end(digest)
+    return cached
+
+
+def _cache_upload(digest: str, file: types.File) -> None:
+    """Remember an uploaded file, evicting the least recently used entry."""
+    _upload_cache[digest] = file
+    _upload_cache.move_to_end(digest)
+    if len(_upload_cache) > _UPLOAD_CACHE_SIZE:
+        _upload_cache.popitem(last=False)
+
+
+def _forget_upload(file: types.File) -> None:
+    """Drop a file from the upload cache, e.g. after it failed to process."""
+    for digest, cached in list(_upload_cache.items()):
+        if cached.name == file.name:
+            del _upload_cache[digest]
+
+
+def _upload_stream(file_path: str, display_name: str) -> types.File:
+    """Upload a file to Gemini from an open binary handle.
+
+    The SDK reads the handle in chunks for the resumable upload, and the
+    display name travels in the request metadata, so non-ASCII file names
+    need no ASCII-safe copy on disk.
+    """
+    mime_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    with open(file_path, "rb", buffering=_UPLOAD_BUFFER_SIZE) as f:
+        return client.files.upload(
+            file=f,
+            config=types.UploadFileConfig(
+                display_name=display_name, mime_type=mime_type
+            ),
+        )
+
 
 async def upload_file(file_path: str, display_name: str | None = None) -> types.File:
-    """Upload a file to Gemini and return the File object."""
+    """Upload a file to Gemini and return the File object.
+
+    Files whose content was already uploaded by this process are served
+    from an in-memory cache keyed by content digest, skipping the upload.
+    Hashing and uploading run in a worker thread so the event loop is not
+    blocked while large files are read and sent.
+    """
     try:
         # Use display_name if provided, otherwise extract from path
         name = display_name or os.path.basename(file_path)
-        logger.info(f"Uploading file: {name}")
 
-        # Create ASCII-safe temporary filename for upload
-        file_ext = os.path.splitext(file_path)[1]
-        temp_filename = f"upload_{uuid.uuid4().hex}{file_ext}"
-        temp_path = os.path.join(os.path.dirname(file_path), temp_filename)
+        # Reuse an earlier upload of identical content
+        digest = await asyncio.to_thread(_file_digest, file_path)
+        cached = _get_cached_upload(digest)
+        if cached is not None:
+            logger.info(f"Reusing uploaded file for {name}: {cached.uri}")
+            return cached
 
-        # Copy file to temp location with ASCII-safe name
-        shutil.copy2(file_path, temp_path)
+        logger.info(f"Uploading file: {name}")
 
-        try:
-            # Upload file using the ASCII-safe path
-            uploaded_file = client.files.upload(file=temp_path)
-            logger.info(f"File uploaded successfully: {uploaded_file.uri}")
-            return uploaded_file
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # Upload from the open file (SDK call is synchronous)
+        uploaded_file = await asyncio.to_thread(_upload_stream, file_path, name)
+        logger.info(f"File uploaded successfully: {uploaded_file.uri}")
+        _cache_upload(digest, uploaded_file)
+        return uploaded_file
 
     except Exception as e:
         logger.error(f"Error uploading file: {str(e)}", exc_info=True)
         raise
 
 
-def wait_for_files_active(files: List[types.File]) -> None:
-    """Block until all provided files are processed and active.
+async def _wait_one(file: types.File) -> None:
+    """Poll a single file until it leaves the ``PROCESSING`` state.
+
+    Polling backs off exponentially from :data:`_POLL_INITIAL_DELAY` to
+    :data:`_POLL_MAX_DELAY`, so small files are picked up quickly without
+    hammering the API for large ones.
+
+    Parameters
+    ----------
+    file : types.File
+        File reference returned by :func:`upload_file`.
+
+    Raises
+    ------
+    Exception
+        If the file has no name or fails to reach the ``ACTIVE`` state. Any
+        failure also drops the file from the upload cache.
+    """
+    if not file.name:
+        raise Exception("File has no name")
+
+    try:
+        # client.files.get is synchronous, run it off the event loop
+        file_obj = await asyncio.to_thread(client.files.get, name=str(file.name))
+        delay = _POLL_INITIAL_DELAY
+        while file_obj.state == "PROCESSING":
+            logger.debug(f"File {file.name} still processing...")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX_DELAY)
+            file_obj = await asyncio.to_thread(client.files.get, name=str(file.name))
+        if file_obj.state != "ACTIVE":
+            raise Exception(f"File {file_obj.name} failed to process")
+    except Exception:
+        # Covers files Gemini already deleted (files.get raises 404), so a
+        # stale cache entry cannot fail every later upload of that content
+        _forget_upload(file)
+        raise
+
+
+async def wait_for_files_active(files: List[types.File]) -> None:
+    """Wait until all provided files are processed and active.
 
-    The function polls the Gemini file status every two seconds until each
-    file transitions from ``PROCESSING`` to ``ACTIVE``. If a file fails to
-    become active, an exception is raised.
+    The Gemini file status of every file is polled concurrently, with
+    exponential backoff, until each file transitions from ``PROCESSING`` to
+    ``ACTIVE``, so the total wait is bounded by the slowest file rather than
+    the sum of all files. If a file fails to become active, an exception is
+    raised.
 
     Parameters
     ----------
@@ -86,17 +215,41 @@ def wait_for_files_active(files: List[types.File]) -> None:
     """
 
     logger.info("Waiting for file processing...")
-    for file in files:
-        if not file.name:
-            raise Exception("File has no name")
-        file_obj = client.files.get(name=str(file.name))
-        while file_obj.state == "PROCESSING":
-            logger.debug("File still processing...")
-            time.sleep(2)
-            file_obj = client.files.get(name=str(file.name))
-        if file_obj.state != "ACTIVE":
-            raise Exception(f"File {file_obj.name} failed to process")
+    await asyncio.gather(*(_wait_one(file) for file in files))
+    logger.info("All files ready")
+
+
+async def upload_and_wait_all(paths: List[str]) -> List[types.File]:
+    """Upload several files and wait for each of them to become active.
+
+    Every file is uploaded and then polled in its own task, so the upload
+    of one file overlaps with Gemini processing of the others.
+
+    Parameters
+    ----------
+    paths : List[str]
+        Local paths of the files to upload.
+
+    Returns
+    -------
+    List[types.File]
+        Active file references, in the same order as ``paths``.
+
+    Raises
+    ------
+    Exception
+        If any upload fails or a file fails to reach the ``ACTIVE`` state.
+    """
+
+    async def _upload_and_wait(path: str) -> types.File:
+        file_ref = await upload_file(path)
+        await _wait_one(file_ref)
+        return file_ref
+
+    logger.info(f"Uploading {len(paths)} file(s)...")
+    files = await asyncio.gather(*(_upload_and_wait(path) for path in paths))
     logger.info("All files ready")
+    return list(files)
 
 
 def create_chat_session(files: Optional[List[types.File]] = None) -> chats.Chat:
@@ -118,20 +271,6 @@ def create_chat_session(files: Optional[List[types.File]] = None) -> chats.Chat:
         A chat session object that can be used to send messages to Gemini.
     """
 
-    # System instruction
-    system_instruction = """You are a helpful assistant. You have access to the provided files.
-
-**Language rule**: Detect the primary language of the document and respond entirely in that language. Do not translate content.
-
-**Task 1 – Summary**
-Summarize the file concisely and clearly, covering the main topics and key findings.
-When referencing a specific fact or section, cite the page inline using the format (p. X), where X is the page number.
-
-**Task 2 – Key Takeaways Q&A**
-End with a Q&A section of the most important takeaways from the document, in the same language as the document.
-
-Format the entire response in clean Markdown (headings, bullet points, bold) for readability."""
-
     # History with files provided
     history = []
     if files:
@@ -152,14 +291,7 @@ Format the entire response in clean Markdown (headings, bullet points, bold) for
     # Create chat session with the new SDK
     chat = client.chats.create(
         model=config.GEMINI_MODEL,
-        config=types.GenerateContentConfig(
-            system_instruction=system_instruction,
-            temperature=generation_config.temperature,
-            top_p=generation_config.top_p,
-            top_k=generation_config.top_k,
-            max_output_tokens=generation_config.max_output_tokens,
-            response_mime_type=generation_config.response_mime_type,
-        ),
+        config=GENERATION_CONFIG,
         history=history if history else None,
     )
     return chat
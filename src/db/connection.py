@@ -7,6 +7,7 @@ and connection lifecycle management.
 """
 
 # imports built-in modules
+import asyncio
 from typing import Optional
 
 # imports third-party modules
@@ -22,6 +23,86 @@ logger = get_db_logger()
 # Database connection pool
 _pool: Optional[asyncpg.Pool] = None
 
+# Serializes pool creation so concurrent first callers share one pool
+_pool_lock = asyncio.Lock()
+
+# Database schema, applied in a single round-trip by init_database
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS users (
+        id SERIAL PRIMARY KEY,
+        username VARCHAR(255) UNIQUE NOT NULL,
+        email VARCHAR(255) UNIQUE NOT NULL,
+        password_hash VARCHAR(255) NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_login TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS chat_sessions (
+        id SERIAL PRIMARY KEY,
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        title VARCHAR(500) NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_deleted BOOLEAN DEFAULT FALSE
+    );
+
+    CREATE TABLE IF NOT EXISTS messages (
+        id SERIAL PRIMARY KEY,
+        chat_session_id INTEGER NOT NULL REFERENCES chat_sessions(id) ON DELETE CASCADE,
+        role VARCHAR(50) NOT NULL,
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS documents (
+        id SERIAL PRIMARY KEY,
+        chat_session_id INTEGER NOT NULL REFERENCES chat_sessions(id) ON DELETE CASCADE,
+        filename VARCHAR(500) NOT NULL,
+        file_path VARCHAR(1000) NOT NULL,
+        gemini_file_uri VARCHAR(1000),
+        gemini_file_name VARCHAR(500),
+        mime_type VARCHAR(100),
+        file_size INTEGER,
+        uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Indexes for better performance
+    CREATE INDEX IF NOT EXISTS idx_chat_sessions_user_id
+    ON chat_sessions(user_id);
+
+    -- Covers the session list query, so it is served by an index-only scan
+    CREATE INDEX IF NOT EXISTS idx_chat_sessions_user_updated_covering
+    ON chat_sessions(user_id, updated_at DESC) INCLUDE (id, title, created_at)
+    WHERE is_deleted = FALSE;
+
+    -- Serves both the FK cascade and the paginated message history
+    DROP INDEX IF EXISTS idx_messages_chat_session_id;
+    CREATE INDEX IF NOT EXISTS idx_messages_session_created
+    ON messages(chat_session_id, created_at);
+
+    -- Serves both the FK cascade and the newest-first document listing
+    DROP INDEX IF EXISTS idx_documents_chat_session_id;
+    CREATE INDEX IF NOT EXISTS idx_documents_session_uploaded
+    ON documents(chat_session_id, uploaded_at DESC);
+"""
+
+# Every relation created by SCHEMA_SQL; the DDL is skipped when all exist
+SCHEMA_RELATIONS = (
+    "users",
+    "chat_sessions",
+    "messages",
+    "documents",
+    "idx_chat_sessions_user_id",
+    "idx_chat_sessions_user_updated_covering",
+    "idx_messages_session_created",
+    "idx_documents_session_uploaded",
+)
+
+_SQL_COUNT_EXISTING_RELATIONS = """
+    SELECT count(*) FROM unnest($1::text[]) AS r(name)
+    WHERE to_regclass(r.name) IS NOT NULL
+"""
+
 
 async def get_pool() -> asyncpg.Pool:
     """Get or create the database connection pool.
@@ -38,10 +119,26 @@ async def get_pool() -> asyncpg.Pool:
     """
     global _pool
     if _pool is None:
-        if not config.DB_URL:
-            raise ValueError("DB_URL environment variable not set")
-
-        _pool = await asyncpg.create_pool(config.DB_URL)
+        async with _pool_lock:
+            # Another task may have created the pool while this one waited
+            if _pool is None:
+                if not config.DB_URL:
+                    raise ValueError("DB_URL environment variable not set")
+
+                # The min_size connections are opened here, at startup, instead of
+                # on the first requests. Prepared statements are cached per
+                # connection for its whole lifetime, so hot queries are parsed and
+                # planned only once. JIT compilation only slows down the short
+                # OLTP queries of this app, so it is turned off per session.
+                _pool = await asyncpg.create_pool(
+                    config.DB_URL,
+                    min_size=config.DB_POOL_MIN_SIZE,
+                    max_size=config.DB_POOL_MAX_SIZE,
+                    command_timeout=config.DB_COMMAND_TIMEOUT,
+                    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+                    max_cached_statement_lifetime=0,
+                    server_settings={"jit": "off", "application_name": "gemini-rag"},
+                )
     return _pool
 
 
@@ -54,74 +151,24 @@ async def close_pool() -> None:
 
 
 async def init_database() -> None:
-    """Initialize database schema with all required tables."""
+    """Initialize database schema with all required tables.
+
+    On a warm start, where every relation in :data:`SCHEMA_RELATIONS`
+    already exists, a single lookup query replaces the DDL. Otherwise all
+    statements are sent in a single ``execute`` call inside a transaction,
+    so a failure leaves the schema untouched.
+    """
     pool = await get_pool()
 
     async with pool.acquire() as conn:
-        # Create users table
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id SERIAL PRIMARY KEY,
-                username VARCHAR(255) UNIQUE NOT NULL,
-                email VARCHAR(255) UNIQUE NOT NULL,
-                password_hash VARCHAR(255) NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_login TIMESTAMP
-            )
-        """)
-
-        # Create chat_sessions table
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS chat_sessions (
-                id SERIAL PRIMARY KEY,
-                user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-                title VARCHAR(500) NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_deleted BOOLEAN DEFAULT FALSE
-            )
-        """)
-
-        # Create messages table
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS messages (
-                id SERIAL PRIMARY KEY,
-                chat_session_id INTEGER NOT NULL REFERENCES chat_sessions(id) ON DELETE CASCADE,
-                role VARCHAR(50) NOT NULL,
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create documents table
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS documents (
-                id SERIAL PRIMARY KEY,
-                chat_session_id INTEGER NOT NULL REFERENCES chat_sessions(id) ON DELETE CASCADE,
-                filename VARCHAR(500) NOT NULL,
-                file_path VARCHAR(1000) NOT NULL,
-                gemini_file_uri VARCHAR(1000),
-                gemini_file_name VARCHAR(500),
-                mime_type VARCHAR(100),
-                file_size INTEGER,
-                uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create indexes for better performance
-        await conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_chat_sessions_user_id 
-            ON chat_sessions(user_id)
-        """)
-
-        await conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_messages_chat_session_id 
-            ON messages(chat_session_id)
-        """)
-
-        await conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_documents_chat_session_id
-            ON documents(chat_session_id)
-        """)
+        existing = await conn.fetchval(
+            _SQL_COUNT_EXISTING_RELATIONS, list(SCHEMA_RELATIONS)
+        )
+        if existing == len(SCHEMA_RELATIONS):
+            logger.info("[OK] Database schema already up to date")
+            return
+
+        async with conn.transaction():
+            await conn.execute(SCHEMA_SQL)
 
         logger.info("[OK] Database schema initialized successfully")
@@ -7,11 +7,19 @@ Contains common password hashing functionality and other shared utilities.
 
 # imports built-in modules
 import hashlib
-import secrets
+import hmac
+
+# imports third-party modules
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Argon2id hasher for new password hashes (RFC 9106 / OWASP: 19 MiB, t=2, p=1)
+ARGON2_PREFIX = "$argon2"
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using SHA-256 with salt.
+    """Hash a password using Argon2id with a random salt.
 
     Parameters
     ----------
@@ -21,16 +29,17 @@ def hash_password(password: str) -> str:
     Returns
     -------
     str
-        Hashed password with salt in format 'salt$hash'.
+        Hashed password in the PHC string format ('$argon2id$...').
     """
-    salt: str = secrets.token_hex(nbytes=16)
-    pwd_hash: str = hashlib.sha256((password + salt).encode()).hexdigest()
-    return f"{salt}${pwd_hash}"
+    return _password_hasher.hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """Verify a password against its hash.
 
+    Argon2id hashes ('$argon2id$...') and legacy SHA-256 hashes
+    ('salt$hash') are accepted.
+
     Parameters
     ----------
     password : str
@@ -43,8 +52,38 @@ def verify_password(password: str, password_hash: str) -> bool:
     bool
         True if password matches, False otherwise.
     """
-    try:
-        salt, pwd_hash = password_hash.split(sep="$")
-        return hashlib.sha256((password + salt).encode()).hexdigest() == pwd_hash
-    except ValueError:
+    if password_hash.startswith(ARGON2_PREFIX):
+        try:
+            return _password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    prefix, sep, rest = password_hash.partition("$")
+    if not sep:
         return False
+
+    # Legacy SHA-256 hash in format 'salt$hash'. Encoding the parts
+    # separately gives the same bytes as encoding password + salt, without
+    # building the concatenated str first.
+    return hmac.compare_digest(
+        hashlib.sha256(password.encode() + prefix.encode()).hexdigest(), rest
+    )
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Check whether a verified hash should be replaced with a fresh one.
+
+    Parameters
+    ----------
+    password_hash : str
+        Stored password hash that was just verified.
+
+    Returns
+    -------
+    bool
+        True for legacy hashes, and for Argon2 hashes made with parameters
+        other than the current ones.
+    """
+    if not password_hash.startswith(ARGON2_PREFIX):
+        return True
+    return _password_hasher.check_needs_rehash(password_hash)
@@ -3,11 +3,58 @@
 Chat session model with CRUD operations.
 """
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import asyncpg
 
 
+# SQL statements
+_SQL_CREATE_SESSION = """
+    INSERT INTO chat_sessions (user_id, title)
+    VALUES ($1, $2)
+    RETURNING id
+"""
+
+_SQL_SESSION_BY_ID = """
+    SELECT id, user_id, title, created_at, updated_at
+    FROM chat_sessions
+    WHERE id = $1 AND user_id = $2 AND is_deleted = FALSE
+"""
+
+_SQL_LIST_SESSIONS_BY_USER = """
+    SELECT id, title, created_at, updated_at
+    FROM chat_sessions
+    WHERE user_id = $1 AND is_deleted = FALSE
+      AND ($2::timestamp IS NULL OR (updated_at, id) < ($2, $3))
+    ORDER BY updated_at DESC, id DESC
+    LIMIT $4
+"""
+
+_SQL_COUNT_SESSIONS_BY_USER = """
+    SELECT COUNT(*) FROM chat_sessions WHERE user_id = $1
+"""
+
+_SQL_UPDATE_SESSION_TITLE = """
+    UPDATE chat_sessions
+    SET title = $1, updated_at = CURRENT_TIMESTAMP
+    WHERE id = $2 AND user_id = $3 AND is_deleted = FALSE
+    RETURNING 1
+"""
+
+_SQL_SOFT_DELETE_SESSION = """
+    UPDATE chat_sessions
+    SET is_deleted = TRUE, updated_at = CURRENT_TIMESTAMP
+    WHERE id = $1 AND user_id = $2
+    RETURNING 1
+"""
+
+# Messages and documents go with the session through ON DELETE CASCADE
+_SQL_DELETE_SESSION = """
+    DELETE FROM chat_sessions WHERE id = $1 AND user_id = $2 RETURNING id
+"""
+
+
 class ChatSession:
     """Chat session model with CRUD operations."""
 
@@ -32,11 +79,7 @@ class ChatSession:
             Chat session ID if successful, None otherwise.
         """
         result = await conn.fetchrow(
-            """
-            INSERT INTO chat_sessions (user_id, title)
-            VALUES ($1, $2)
-            RETURNING id
-            """,
+            _SQL_CREATE_SESSION,
             user_id,
             title,
         )
@@ -63,11 +106,7 @@ class ChatSession:
             Session data if found and owned by user, None otherwise.
         """
         session = await conn.fetchrow(
-            """
-            SELECT id, user_id, title, created_at, updated_at
-            FROM chat_sessions
-            WHERE id = $1 AND user_id = $2 AND is_deleted = FALSE
-            """,
+            _SQL_SESSION_BY_ID,
             session_id,
             user_id,
         )
@@ -75,9 +114,17 @@ class ChatSession:
 
     @staticmethod
     async def list_by_user(
-        conn: asyncpg.Connection, user_id: int
-    ) -> List[Dict[str, Any]]:
-        """List all chat sessions for a user.
+        conn: asyncpg.Connection,
+        user_id: int,
+        before: Optional[Tuple[datetime, int]] = None,
+        limit: int = 50,
+    ) -> List[asyncpg.Record]:
+        """List chat sessions for a user, most recently updated first.
+
+        Results are paginated with a keyset cursor: pass the ``updated_at``
+        and ``id`` of the last session of a page as ``before`` to get the
+        next page. The id breaks ties between sessions updated at the same
+        time, so none are skipped or repeated across pages.
 
         Parameters
         ----------
@@ -85,22 +132,26 @@ class ChatSession:
             Database connection.
         user_id : int
             User ID.
+        before : Optional[Tuple[datetime, int]]
+            Only return sessions ordered after this ``(updated_at, id)``
+            cursor.
+        limit : int
+            Maximum number of sessions to return (default: 50).
 
         Returns
         -------
-        List[Dict[str, Any]]
-            List of chat sessions.
+        List[asyncpg.Record]
+            List of chat sessions. Records support access by column name
+            like dicts, so they are returned without copying.
         """
-        sessions = await conn.fetch(
-            """
-            SELECT id, title, created_at, updated_at
-            FROM chat_sessions
-            WHERE user_id = $1 AND is_deleted = FALSE
-            ORDER BY updated_at DESC
-            """,
+        before_updated_at, before_id = before or (None, None)
+        return await conn.fetch(
+            _SQL_LIST_SESSIONS_BY_USER,
             user_id,
+            before_updated_at,
+            before_id,
+            limit,
         )
-        return [dict(s) for s in sessions]
 
     @staticmethod
     async def count_by_user(conn: asyncpg.Connection, user_id: int) -> int:
@@ -119,9 +170,7 @@ class ChatSession:
             Total count of chat sessions.
         """
         result = await conn.fetchval(
-            """
-            SELECT COUNT(*) FROM chat_sessions WHERE user_id = $1
-            """,
+            _SQL_COUNT_SESSIONS_BY_USER,
             user_id,
         )
         return result or 0
@@ -148,17 +197,13 @@ class ChatSession:
         bool
             True if updated successfully, False otherwise.
         """
-        result = await conn.execute(
-            """
-            UPDATE chat_sessions
-            SET title = $1, updated_at = CURRENT_TIMESTAMP
-            WHERE id = $2 AND user_id = $3 AND is_deleted = FALSE
-            """,
+        updated = await conn.fetchval(
+            _SQL_UPDATE_SESSION_TITLE,
             new_title,
             session_id,
             user_id,
         )
-        return result != "UPDATE 0"
+        return updated is not None
 
     @staticmethod
     async def delete(conn: asyncpg.Connection, session_id: int, user_id: int) -> bool:
@@ -178,16 +223,12 @@ class ChatSession:
         bool
             True if deleted successfully, False otherwise.
         """
-        result = await conn.execute(
-            """
-            UPDATE chat_sessions
-            SET is_deleted = TRUE, updated_at = CURRENT_TIMESTAMP
-            WHERE id = $1 AND user_id = $2
-            """,
+        deleted = await conn.fetchval(
+            _SQL_SOFT_DELETE_SESSION,
             session_id,
             user_id,
         )
-        return result != "UPDATE 0"
+        return deleted is not None
 
     @staticmethod
     async def hard_delete(
@@ -195,7 +236,9 @@ class ChatSession:
     ) -> bool:
         """Hard delete a chat session and all related records.
 
-        Deletes messages and documents first, then the chat session.
+        Messages and documents are removed by the ``ON DELETE CASCADE``
+        foreign keys, so ownership check and deletion are a single
+        statement.
 
         Parameters
         ----------
@@ -211,31 +254,9 @@ class ChatSession:
         bool
             True if deleted successfully, False otherwise.
         """
-        # Verify ownership first
-        session = await conn.fetchrow(
-            "SELECT id FROM chat_sessions WHERE id = $1 AND user_id = $2",
-            session_id,
-            user_id,
-        )
-        if not session:
-            return False
-
-        # Delete documents first
-        await conn.execute(
-            "DELETE FROM documents WHERE chat_session_id = $1",
-            session_id,
-        )
-
-        # Delete messages
-        await conn.execute(
-            "DELETE FROM messages WHERE chat_session_id = $1",
-            session_id,
-        )
-
-        # Delete chat session
-        result = await conn.execute(
-            "DELETE FROM chat_sessions WHERE id = $1 AND user_id = $2",
+        deleted_id = await conn.fetchval(
+            _SQL_DELETE_SESSION,
             session_id,
             user_id,
         )
-        return result != "DELETE 0"
+        return deleted_id is not None
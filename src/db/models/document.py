@@ -3,10 +3,39 @@
 Document model with CRUD operations.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import List, Optional, Tuple
 
 import asyncpg
 
+# SQL statements
+_SQL_CREATE_DOCUMENT = """
+    INSERT INTO documents (
+        chat_session_id, filename, file_path, gemini_file_uri,
+        gemini_file_name, mime_type, file_size
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    RETURNING id
+"""
+
+_SQL_LIST_DOCUMENTS_BY_SESSION = """
+    SELECT id, filename, file_path, gemini_file_uri, gemini_file_name,
+           mime_type, file_size, uploaded_at
+    FROM documents
+    WHERE chat_session_id = $1
+    ORDER BY uploaded_at DESC
+"""
+
+# Column order of the records accepted by Document.create_many
+DOCUMENT_COLUMNS = (
+    "chat_session_id",
+    "filename",
+    "file_path",
+    "gemini_file_uri",
+    "gemini_file_name",
+    "mime_type",
+    "file_size",
+)
+
 
 class Document:
     """Document model with CRUD operations."""
@@ -49,14 +78,7 @@ class Document:
             Document ID if successful, None otherwise.
         """
         result = await conn.fetchrow(
-            """
-            INSERT INTO documents (
-                chat_session_id, filename, file_path, gemini_file_uri,
-                gemini_file_name, mime_type, file_size
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            RETURNING id
-            """,
+            _SQL_CREATE_DOCUMENT,
             chat_session_id,
             filename,
             file_path,
@@ -67,10 +89,50 @@ class Document:
         )
         return result["id"] if result else None
 
+    @staticmethod
+    async def create_many(
+        conn: asyncpg.Connection,
+        rows: List[
+            Tuple[
+                int,
+                str,
+                str,
+                Optional[str],
+                Optional[str],
+                Optional[str],
+                Optional[int],
+            ]
+        ],
+    ) -> int:
+        """Create many document records in one COPY operation.
+
+        Intended for bulk ingestion, where inserting one row at a time
+        would cost one round-trip per document.
+
+        Parameters
+        ----------
+        conn : asyncpg.Connection
+            Database connection.
+        rows : List[Tuple[...]]
+            Document records in :data:`DOCUMENT_COLUMNS` order.
+
+        Returns
+        -------
+        int
+            Number of documents created.
+        """
+        if not rows:
+            return 0
+
+        await conn.copy_records_to_table(
+            "documents", records=rows, columns=DOCUMENT_COLUMNS
+        )
+        return len(rows)
+
     @staticmethod
     async def list_by_session(
         conn: asyncpg.Connection, chat_session_id: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[asyncpg.Record]:
         """List all documents in a chat session.
 
         Parameters
@@ -82,18 +144,12 @@ class Document:
 
         Returns
         -------
-        List[Dict[str, Any]]
-            List of documents.
+        List[asyncpg.Record]
+            List of documents. Records support access by column name like
+            dicts, so they are returned without copying.
         """
-        documents = await conn.fetch(
-            """
-            SELECT id, filename, file_path, gemini_file_uri, gemini_file_name,
-                   mime_type, file_size, uploaded_at
-            FROM documents
-            WHERE chat_session_id = $1
-            ORDER BY uploaded_at DESC
-            """,
+        return await conn.fetch(
+            _SQL_LIST_DOCUMENTS_BY_SESSION,
             chat_session_id,
         )
-        return [dict(d) for d in documents]
 
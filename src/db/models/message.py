@@ -3,11 +3,42 @@
 Message model with CRUD operations.
 """
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 import asyncpg
 
 
+# SQL statements
+# Inserts the message and touches the session's updated_at in one statement
+_SQL_CREATE_MESSAGE = """
+    WITH ins AS (
+        INSERT INTO messages (chat_session_id, role, content)
+        VALUES ($1, $2, $3)
+        RETURNING id
+    ), touch AS (
+        UPDATE chat_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = $1
+    )
+    SELECT id FROM ins
+"""
+
+_SQL_TOUCH_SESSIONS = """
+    UPDATE chat_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = ANY($1::int[])
+"""
+
+_SQL_LIST_MESSAGES_BY_SESSION = """
+    SELECT id, role, content, created_at
+    FROM messages
+    WHERE chat_session_id = $1
+      AND ($2::timestamp IS NULL OR (created_at, id) < ($2, $3))
+    ORDER BY created_at DESC, id DESC
+    LIMIT $4
+"""
+
+# Column order of the records accepted by Message.create_many
+MESSAGE_COLUMNS = ("chat_session_id", "role", "content")
+
+
 class Message:
     """Message model with CRUD operations."""
 
@@ -17,6 +48,9 @@ class Message:
     ) -> Optional[int]:
         """Create a new message.
 
+        The chat session's ``updated_at`` timestamp is bumped by the same
+        statement, so both writes take a single round-trip.
+
         Parameters
         ----------
         conn : asyncpg.Connection
@@ -33,30 +67,59 @@ class Message:
         Optional[int]
             Message ID if successful, None otherwise.
         """
-        result = await conn.fetchrow(
-            """
-            INSERT INTO messages (chat_session_id, role, content)
-            VALUES ($1, $2, $3)
-            RETURNING id
-            """,
+        return await conn.fetchval(
+            _SQL_CREATE_MESSAGE,
             chat_session_id,
             role,
             content,
         )
 
-        # Update chat session's updated_at timestamp
-        await conn.execute(
-            "UPDATE chat_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = $1",
-            chat_session_id,
-        )
+    @staticmethod
+    async def create_many(
+        conn: asyncpg.Connection, rows: List[Tuple[int, str, str]]
+    ) -> int:
+        """Create many messages in one COPY operation.
 
-        return result["id"] if result else None
+        The rows are copied and the ``updated_at`` timestamp of every
+        affected chat session is bumped in one transaction.
+
+        Parameters
+        ----------
+        conn : asyncpg.Connection
+            Database connection.
+        rows : List[Tuple[int, str, str]]
+            Message records in :data:`MESSAGE_COLUMNS` order.
+
+        Returns
+        -------
+        int
+            Number of messages created.
+        """
+        if not rows:
+            return 0
+
+        session_ids = list({chat_session_id for chat_session_id, _, _ in rows})
+        async with conn.transaction():
+            await conn.copy_records_to_table(
+                "messages", records=rows, columns=MESSAGE_COLUMNS
+            )
+            await conn.execute(_SQL_TOUCH_SESSIONS, session_ids)
+        return len(rows)
 
     @staticmethod
     async def list_by_session(
-        conn: asyncpg.Connection, chat_session_id: int
-    ) -> List[Dict[str, Any]]:
-        """List all messages in a chat session.
+        conn: asyncpg.Connection,
+        chat_session_id: int,
+        before: Optional[Tuple[datetime, int]] = None,
+        limit: int = 200,
+    ) -> List[asyncpg.Record]:
+        """List the most recent messages in a chat session.
+
+        Results are paginated with a keyset cursor: pass the ``created_at``
+        and ``id`` of the first message of a page as ``before`` to get the
+        previous, older page. Messages stored by :meth:`create_many` share
+        one ``created_at``, so the id keeps them from being skipped or
+        repeated across pages.
 
         Parameters
         ----------
@@ -64,20 +127,27 @@ class Message:
             Database connection.
         chat_session_id : int
             Chat session ID.
+        before : Optional[Tuple[datetime, int]]
+            Only return messages older than this ``(created_at, id)``
+            cursor.
+        limit : int
+            Maximum number of messages to return (default: 200).
 
         Returns
         -------
-        List[Dict[str, Any]]
-            List of messages ordered by creation time.
+        List[asyncpg.Record]
+            List of messages ordered by creation time, oldest first.
+            Records support access by column name like dicts, so they are
+            returned without copying.
         """
+        before_created_at, before_id = before or (None, None)
         messages = await conn.fetch(
-            """
-            SELECT id, role, content, created_at
-            FROM messages
-            WHERE chat_session_id = $1
-            ORDER BY created_at ASC
-            """,
+            _SQL_LIST_MESSAGES_BY_SESSION,
             chat_session_id,
+            before_created_at,
+            before_id,
+            limit,
         )
-        return [dict(m) for m in messages]
-
+        # Fetched newest first so LIMIT keeps the latest messages
+        messages.reverse()
+        return messages
@@ -3,11 +3,167 @@
 User model with authentication methods.
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import asyncpg
 
-from src.db.models.base import hash_password, verify_password
+from src.db.connection import get_pool
+from src.db.models.base import hash_password, needs_rehash, verify_password
+from src.utils.logger import get_db_logger
+
+# SQL statements
+_SQL_TOUCH_LAST_LOGINS = """
+    UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ANY($1::int[])
+"""
+
+_SQL_CREATE_USER = """
+    INSERT INTO users (username, email, password_hash)
+    VALUES ($1, $2, $3)
+    RETURNING id
+"""
+
+# Login lookups probe the username and email unique indexes separately
+# rather than relying on the planner to turn the OR into a bitmap scan
+_SQL_USER_BY_LOGIN = """
+    SELECT id, username, email, password_hash FROM users WHERE username = $1
+    UNION ALL
+    SELECT id, username, email, password_hash FROM users WHERE email = $1
+    LIMIT 1
+"""
+
+_SQL_USER_BY_ID = """
+    SELECT id, username, email, created_at, last_login FROM users WHERE id = $1
+"""
+
+_SQL_USER_ID_BY_LOGIN = """
+    SELECT id FROM users WHERE username = $1
+    UNION ALL
+    SELECT id FROM users WHERE email = $1
+    LIMIT 1
+"""
+
+_SQL_UPDATE_PASSWORD = "UPDATE users SET password_hash = $1 WHERE id = $2"
+
+# Only replaces the hash that was verified, so a password changed since the
+# login is not overwritten with a hash of the old one
+_SQL_REHASH_PASSWORD = """
+    UPDATE users SET password_hash = $1 WHERE id = $2 AND password_hash = $3
+"""
+
+# Database logger
+logger = get_db_logger()
+
+# Password hashing and verification run here, off the event loop. Each
+# Argon2id call holds ~19 MiB, so the pool size also bounds that memory.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="password"
+)
+
+# Users fetched by get_by_id, keyed by id, as (fetch time, user data) pairs
+_USER_CACHE_SIZE = 10_000
+_USER_CACHE_TTL = 60.0
+_user_cache: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Verified in place of a stored hash when no user matches, so unknown
+# logins take as long as wrong passwords and do not reveal which exist
+_DUMMY_HASH = hash_password("dummy password")
+
+# Background tasks are referenced here until done so they are not collected
+_background_tasks: Set[asyncio.Task] = set()
+
+# Logins are coalesced and their last_login stamped in one batch per delay
+_LAST_LOGIN_FLUSH_DELAY = 5.0
+_pending_logins: Set[int] = set()
+_last_login_flush: Optional[asyncio.Task] = None
+
+
+def _get_cached_user(user_id: int) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached user if it was fetched within the TTL."""
+    entry = _user_cache.get(user_id)
+    if entry is None:
+        return None
+
+    fetched_at, user = entry
+    if time.monotonic() - fetched_at > _USER_CACHE_TTL:
+        del _user_cache[user_id]
+        return None
+
+    _user_cache.move_to_end(user_id)
+    return dict(user)
+
+
+def _cache_user(user: Dict[str, Any]) -> None:
+    """Remember a fetched user, evicting the least recently used entry."""
+    _user_cache[user["id"]] = (time.monotonic(), dict(user))
+    _user_cache.move_to_end(user["id"])
+    if len(_user_cache) > _USER_CACHE_SIZE:
+        _user_cache.popitem(last=False)
+
+
+def _forget_user(user_id: int) -> None:
+    """Drop a user from the cache after their row was updated."""
+    _user_cache.pop(user_id, None)
+
+
+async def _run_password_op(func, *args):
+    """Run a password hashing or verification function on the executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, func, *args)
+
+
+def _record_login(user_id: int) -> None:
+    """Queue a user's last_login update, starting a flush if none is pending."""
+    global _last_login_flush
+    _pending_logins.add(user_id)
+    # A flush cancelled during its sleep, or whose loop closed, never resets
+    # the global, so a finished task is replaced as well
+    if _last_login_flush is None or _last_login_flush.done():
+        _last_login_flush = _run_in_background(_flush_last_logins())
+
+
+async def _flush_last_logins() -> None:
+    """Stamp last_login for all queued users with a single UPDATE."""
+    global _last_login_flush
+    await asyncio.sleep(_LAST_LOGIN_FLUSH_DELAY)
+
+    # Logins arriving from here on start the next batch
+    user_ids = list(_pending_logins)
+    _pending_logins.clear()
+    _last_login_flush = None
+    try:
+        pool = await get_pool()
+        await pool.execute(_SQL_TOUCH_LAST_LOGINS, user_ids)
+        for user_id in user_ids:
+            _forget_user(user_id)
+    except Exception as e:
+        logger.error(f"Failed to update last login for users {user_ids}: {e}")
+
+
+async def _rehash_password(user_id: int, password: str, old_hash: str) -> None:
+    """Replace a user's outdated password hash with a fresh Argon2id hash.
+
+    Nothing is written if the stored hash is no longer ``old_hash``.
+    """
+    try:
+        password_hash = await _run_password_op(hash_password, password)
+        pool = await get_pool()
+        await pool.execute(_SQL_REHASH_PASSWORD, password_hash, user_id, old_hash)
+        _forget_user(user_id)
+    except Exception as e:
+        logger.error(f"Failed to rehash password for user {user_id}: {e}")
+
+
+def _run_in_background(coro) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it, keeping its task referenced."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 
 class User:
@@ -15,14 +171,18 @@ class User:
 
     @staticmethod
     async def create(
-        conn: asyncpg.Connection, username: str, email: str, password: str
+        conn: Union[asyncpg.Connection, asyncpg.Pool],
+        username: str,
+        email: str,
+        password: str,
     ) -> Optional[int]:
         """Create a new user.
 
         Parameters
         ----------
-        conn : asyncpg.Connection
-            Database connection.
+        conn : Union[asyncpg.Connection, asyncpg.Pool]
+            Database connection, or a pool to check a connection out of
+            only for the INSERT, after the password has been hashed.
         username : str
             Unique username.
         email : str
@@ -36,13 +196,9 @@ class User:
             User ID if successful, None otherwise.
         """
         try:
-            password_hash = hash_password(password)
+            password_hash = await _run_password_op(hash_password, password)
             result = await conn.fetchrow(
-                """
-                INSERT INTO users (username, email, password_hash)
-                VALUES ($1, $2, $3)
-                RETURNING id
-                """,
+                _SQL_CREATE_USER,
                 username,
                 email,
                 password_hash,
@@ -51,16 +207,60 @@ class User:
         except asyncpg.UniqueViolationError:
             return None
 
+    @staticmethod
+    async def bulk_create(
+        conn: asyncpg.Connection, users: List[Tuple[str, str, str]]
+    ) -> int:
+        """Create many users in one COPY operation.
+
+        Passwords are hashed concurrently on the password executor, then
+        all rows are written with a single ``copy_records_to_table`` call.
+        The whole batch fails if any username or email already exists.
+
+        Parameters
+        ----------
+        conn : asyncpg.Connection
+            Database connection.
+        users : List[Tuple[str, str, str]]
+            ``(username, email, password)`` tuples with plain text passwords.
+
+        Returns
+        -------
+        int
+            Number of users created.
+        """
+        if not users:
+            return 0
+
+        password_hashes = await asyncio.gather(
+            *(_run_password_op(hash_password, password) for _, _, password in users)
+        )
+        records = [
+            (username, email, password_hash)
+            for (username, email, _), password_hash in zip(users, password_hashes)
+        ]
+        await conn.copy_records_to_table(
+            "users", records=records, columns=("username", "email", "password_hash")
+        )
+        return len(records)
+
     @staticmethod
     async def authenticate(
-        conn: asyncpg.Connection, username: str, password: str
+        conn: Union[asyncpg.Connection, asyncpg.Pool], username: str, password: str
     ) -> Optional[Dict[str, Any]]:
         """Authenticate a user.
 
+        The ``last_login`` timestamp is updated in the background after the
+        password has been verified, batched with the other logins of the
+        next :data:`_LAST_LOGIN_FLUSH_DELAY` seconds. Outdated SHA-256 or
+        Argon2 hashes are transparently replaced with a current Argon2id
+        hash as well.
+
         Parameters
         ----------
-        conn : asyncpg.Connection
-            Database connection.
+        conn : Union[asyncpg.Connection, asyncpg.Pool]
+            Database connection, or a pool to check a connection out of
+            only for the lookup, so none is held during verification.
         username : str
             Username or email.
         password : str
@@ -72,26 +272,30 @@ class User:
             User data if authentication successful, None otherwise.
         """
         user = await conn.fetchrow(
-            """
-            SELECT id, username, email, password_hash
-            FROM users
-            WHERE username = $1 OR email = $1
-            """,
+            _SQL_USER_BY_LOGIN,
             username,
         )
 
-        if user and verify_password(password, user["password_hash"]):
-            # Update last login
-            await conn.execute(
-                "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = $1",
-                user["id"],
+        # Verification is deliberately slow, so keep it off the event loop
+        if not user:
+            await _run_password_op(verify_password, password, _DUMMY_HASH)
+            return None
+        if not await _run_password_op(verify_password, password, user["password_hash"]):
+            return None
+
+        # Update last login in the background so the login is not held up
+        # by the write. The batch uses its own pooled connection because
+        # ``conn`` may be released before it runs.
+        _record_login(user["id"])
+        if needs_rehash(user["password_hash"]):
+            _run_in_background(
+                _rehash_password(user["id"], password, user["password_hash"])
             )
-            return {
-                "id": user["id"],
-                "username": user["username"],
-                "email": user["email"],
-            }
-        return None
+        return {
+            "id": user["id"],
+            "username": user["username"],
+            "email": user["email"],
+        }
 
     @staticmethod
     async def get_by_id(
@@ -99,6 +303,10 @@ class User:
     ) -> Optional[Dict[str, Any]]:
         """Get user by ID.
 
+        Results are cached in-process for :data:`_USER_CACHE_TTL` seconds,
+        so repeated lookups skip the database round-trip. Updates made
+        through this model invalidate the cached entry.
+
         Parameters
         ----------
         conn : asyncpg.Connection
@@ -111,11 +319,19 @@ class User:
         Optional[Dict[str, Any]]
             User data if found, None otherwise.
         """
+        cached = _get_cached_user(user_id)
+        if cached is not None:
+            return cached
+
         user = await conn.fetchrow(
-            "SELECT id, username, email, created_at, last_login FROM users WHERE id = $1",
+            _SQL_USER_BY_ID,
             user_id,
         )
-        return dict(user) if user else None
+        if not user:
+            return None
+
+        _cache_user(dict(user))
+        return dict(user)
 
     @staticmethod
     async def update_password(
@@ -142,17 +358,18 @@ class User:
         """
         # look up the user first
         user = await conn.fetchrow(
-            "SELECT id FROM users WHERE username = $1 OR email = $1",
+            _SQL_USER_ID_BY_LOGIN,
             username_or_email,
         )
         if not user:
             return False
 
-        password_hash = hash_password(new_password)
+        password_hash = await _run_password_op(hash_password, new_password)
         result = await conn.execute(
-            "UPDATE users SET password_hash = $1 WHERE id = $2",
+            _SQL_UPDATE_PASSWORD,
             password_hash,
             user["id"],
         )
+        _forget_user(user["id"])
         # asyncpg returns a string like 'UPDATE 1' when a row was affected
         return result.startswith("UPDATE") and result.endswith("1")
@@ -7,14 +7,36 @@ for different error scenarios.
 """
 
 
+def _rebuild(cls: type, args: tuple, state: dict) -> "RAGAppError":
+    """Recreate an unpickled error without calling its ``__init__``."""
+    error = cls.__new__(cls)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
+
 class RAGAppError(Exception):
-    """Base exception for all application errors."""
+    """Base exception for all application errors.
+
+    Attributes live in slots, and subclasses declare empty ``__slots__``.
+    ``BaseException`` still provides a ``__dict__``, but it is only
+    allocated if something else is assigned to the instance.
+    """
+
+    __slots__ = ("message", "details")
 
     def __init__(self, message: str, details: str | None = None):
         self.message = message
         self.details = details
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # Slot attributes are not part of the default pickled state, and
+        # subclass __init__ signatures differ, so rebuild without __init__
+        state = {**self.__dict__, "message": self.message, "details": self.details}
+        return (_rebuild, (type(self), self.args, state))
+
     def __str__(self) -> str:
         if self.details:
             return f"{self.message}: {self.details}"
@@ -25,31 +47,33 @@ class RAGAppError(Exception):
 class DatabaseError(RAGAppError):
     """Base exception for database-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class ConnectionError(DatabaseError):
     """Database connection failed."""
 
-    pass
+    __slots__ = ()
 
 
 class QueryError(DatabaseError):
     """Database query execution failed."""
 
-    pass
+    __slots__ = ()
 
 
 # Authentication Exceptions
 class AuthenticationError(RAGAppError):
     """Base exception for authentication-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidCredentialsError(AuthenticationError):
     """Invalid username or password."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Invalid username or password")
 
@@ -57,6 +81,8 @@ class InvalidCredentialsError(AuthenticationError):
 class UserNotFoundError(AuthenticationError):
     """User not found."""
 
+    __slots__ = ()
+
     def __init__(self, identifier: str):
         super().__init__(f"User not found: {identifier}")
 
@@ -64,6 +90,8 @@ class UserNotFoundError(AuthenticationError):
 class UserAlreadyExistsError(AuthenticationError):
     """User already exists."""
 
+    __slots__ = ()
+
     def __init__(self, field: str, value: str):
         super().__init__(f"User with {field} '{value}' already exists")
 
@@ -72,24 +100,26 @@ class UserAlreadyExistsError(AuthenticationError):
 class FileProcessingError(RAGAppError):
     """Base exception for file processing errors."""
 
-    pass
+    __slots__ = ()
 
 
 class FileUploadError(FileProcessingError):
     """File upload failed."""
 
-    pass
+    __slots__ = ()
 
 
 class FileNotFoundError(FileProcessingError):
     """Requested file not found."""
 
-    pass
+    __slots__ = ()
 
 
 class UnsupportedFileTypeError(FileProcessingError):
     """File type not supported."""
 
+    __slots__ = ()
+
     def __init__(self, mime_type: str):
         super().__init__(f"Unsupported file type: {mime_type}")
 
@@ -98,37 +128,39 @@ class UnsupportedFileTypeError(FileProcessingError):
 class GeminiAPIError(RAGAppError):
     """Base exception for Gemini API errors."""
 
-    pass
+    __slots__ = ()
 
 
 class GeminiUploadError(GeminiAPIError):
     """File upload to Gemini failed."""
 
-    pass
+    __slots__ = ()
 
 
 class GeminiProcessingError(GeminiAPIError):
     """Gemini file processing failed."""
 
-    pass
+    __slots__ = ()
 
 
 class GeminiChatError(GeminiAPIError):
     """Gemini chat session error."""
 
-    pass
+    __slots__ = ()
 
 
 # Session Exceptions
 class SessionError(RAGAppError):
     """Base exception for session-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class SessionNotFoundError(SessionError):
     """Chat session not found."""
 
+    __slots__ = ()
+
     def __init__(self, session_id: int):
         super().__init__(f"Chat session not found: {session_id}")
 
@@ -136,6 +168,8 @@ class SessionNotFoundError(SessionError):
 class SessionAccessDeniedError(SessionError):
     """User does not have access to this session."""
 
+    __slots__ = ()
+
     def __init__(self, session_id: int):
         super().__init__(f"Access denied to session: {session_id}")
 
@@ -11,6 +11,26 @@ from typing import Optional
 
 from google.genai import types
 
+# Page citations, either inline after a quote ('", p. X)') or standalone
+# ('(p. X)'), each optionally with a page range ('p. X-Y')
+_CITATION_RE = re.compile(
+    r"""
+    (?P<inline>",\s*p\.\s*(?P<inline_start>\d+)(?:-(?P<inline_end>\d+))?\))
+    | (?P<standalone>\(p\.\s*(?P<standalone_start>\d+)(?:-(?P<standalone_end>\d+))?\))
+    """,
+    re.VERBOSE,
+)
+
+
+def _citation_link(match: re.Match, citation_path: str) -> str:
+    """Render a matched page citation as a Markdown link to the PDF page."""
+    kind = match.lastgroup
+    start = match.group(f"{kind}_start")
+    end = match.group(f"{kind}_end")
+    pages = f"{start}-{end}" if end else start
+    link = f"[p. {pages}](/public/{citation_path}#page={start})"
+    return f'", {link})' if kind == "inline" else f"({link})"
+
 
 def format_response_with_citations(
     response: types.GenerateContentResponse,
@@ -45,31 +65,11 @@ def format_response_with_citations(
     # Determine the path to use for citations
     citation_path = file_path if file_path else source_document_name
 
-    # Link page citations if source document is provided
-    if citation_path and answer_text:
-        # Pattern for ", p. X)" - inline citations with quotes
-        answer_text = re.sub(
-            r'",\s*p\.\s*(\d+)\)',
-            rf'", [p. \1](/public/{citation_path}#page=\1))',
-            answer_text,
-        )
-        # Pattern for (p. X) - standalone citations
-        answer_text = re.sub(
-            r"\(p\.\s*(\d+)\)",
-            rf"([p. \1](/public/{citation_path}#page=\1))",
-            answer_text,
-        )
-        # Pattern for ", p. X-Y)" - inline range citations
-        answer_text = re.sub(
-            r'",\s*p\.\s*(\d+)-(\d+)\)',
-            rf'", [p. \1-\2](/public/{citation_path}#page=\1))',
-            answer_text,
-        )
-        # Pattern for (p. X-Y) - standalone range citations
-        answer_text = re.sub(
-            r"\(p\.\s*(\d+)-(\d+)\)",
-            rf"([p. \1-\2](/public/{citation_path}#page=\1))",
-            answer_text,
+    # Link page citations if source document is provided; the substring
+    # check skips the regex for the common reply without any citation
+    if citation_path and "p." in answer_text:
+        answer_text = _CITATION_RE.sub(
+            lambda match: _citation_link(match, citation_path), answer_text
         )
 
     citations = []
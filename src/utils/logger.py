@@ -5,15 +5,36 @@ Logging utilities.
 Provides centralized logging configuration for the application.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from src.config import config
 
 
+def _attach_queued_handlers(
+    logger: logging.Logger, handlers: List[logging.Handler]
+) -> None:
+    """Attach handlers to a logger behind an in-memory queue.
+
+    Log calls only enqueue the record; a listener thread formats it and
+    performs the blocking writes, so logging from async code does not
+    stall the event loop. The listener is flushed and stopped at exit.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
 def setup_logger(
     name: str,
     log_file: Optional[str] = None,
@@ -22,12 +43,15 @@ def setup_logger(
 ) -> logging.Logger:
     """Set up a logger with file and/or console handlers.
 
+    The handlers are fed through a queue, see :func:`_attach_queued_handlers`.
+
     Parameters
     ----------
     name : str
         Logger name (typically __name__ of the calling module).
     log_file : Optional[str]
-        Log file name. If None, only console logging is enabled.
+        Log file name. If None, only console logging is enabled. The file
+        is rotated at midnight, keeping 30 days of logs.
     level : int
         Logging level (default: logging.INFO).
     console_output : bool
@@ -51,6 +75,8 @@ def setup_logger(
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    handlers: List[logging.Handler] = []
+
     # Add file handler if log_file is specified
     if log_file:
         # Ensure logs directory exists
@@ -58,21 +84,29 @@ def setup_logger(
         logs_dir.mkdir(exist_ok=True)
 
         log_path = logs_dir / log_file
-        file_handler = logging.FileHandler(log_path)
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            log_path, when="midnight", backupCount=30, encoding="utf-8"
+        )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # Add console handler if requested
     if console_output:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if handlers:
+        _attach_queued_handlers(logger, handlers)
 
     return logger
 
 
+# The getters below are cached: loggers are configured once per process and
+# later calls return the same instance.
+@functools.cache
 def get_app_logger():
     logger = logging.getLogger("gemini_rag")
 
@@ -82,19 +116,19 @@ def get_app_logger():
             "%(asctime)s - %(name)s - %(module)s - %(levelname)s - %(message)s"
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        _attach_queued_handlers(logger, [handler])
         logger.setLevel(logging.INFO)
 
     return logger
 
 
+@functools.cache
 def get_db_logger() -> logging.Logger:
     """Get the database operations logger."""
-    today = datetime.now().strftime("%Y-%m-%d")
-    return setup_logger("gemini_rag.db", log_file=f"db_{today}.log")
+    return setup_logger("gemini_rag.db", log_file="db.log")
 
 
+@functools.cache
 def get_auth_logger() -> logging.Logger:
     """Get the authentication logger."""
-    today = datetime.now().strftime("%Y-%m-%d")
-    return setup_logger("gemini_rag.auth", log_file=f"auth_{today}.log")
+    return setup_logger("gemini_rag.auth", log_file="auth.log")
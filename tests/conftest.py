@@ -17,6 +17,9 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Modules that build a Gemini client at import need an API key to load
+os.environ.setdefault("GOOGLE_API_KEY", "test_api_key")
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
@@ -92,4 +95,3 @@ trailer
 startxref
 196
 %%EOF"""
-
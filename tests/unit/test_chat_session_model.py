@@ -0,0 +1,79 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.db.models.chat_session import ChatSession
+
+
+@pytest.mark.asyncio
+async def test_list_by_user_first_page():
+    """Test listing without a cursor passes NULL and the default limit."""
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[{"id": 1, "title": "Chat"}])
+
+    result = await ChatSession.list_by_user(mock_conn, 7)
+
+    assert result == [{"id": 1, "title": "Chat"}]
+    call_args = mock_conn.fetch.call_args[0]
+    assert "LIMIT" in call_args[0].upper()
+    assert call_args[1:] == (7, None, None, 50)
+
+
+@pytest.mark.asyncio
+async def test_list_by_user_with_cursor():
+    """Test the (updated_at, id) keyset cursor and limit reach the query."""
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[])
+    updated_at = datetime(2025, 1, 1, 12, 0)
+
+    await ChatSession.list_by_user(mock_conn, 7, before=(updated_at, 42), limit=10)
+
+    call_args = mock_conn.fetch.call_args[0]
+    assert "ORDER BY UPDATED_AT DESC, ID DESC" in " ".join(call_args[0].upper().split())
+    assert call_args[1:] == (7, updated_at, 42, 10)
+
+
+@pytest.mark.asyncio
+async def test_hard_delete_single_statement():
+    """Test hard delete relies on cascades and sends one DELETE."""
+    mock_conn = AsyncMock()
+    mock_conn.fetchval = AsyncMock(return_value=5)
+
+    result = await ChatSession.hard_delete(mock_conn, 5, 1)
+
+    assert result is True
+    mock_conn.fetchval.assert_called_once()
+    assert mock_conn.fetchval.call_args[0][1:] == (5, 1)
+    mock_conn.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_hard_delete_not_owned():
+    """Test hard delete returns False when the session is not the user's."""
+    mock_conn = AsyncMock()
+    mock_conn.fetchval = AsyncMock(return_value=None)
+
+    assert await ChatSession.hard_delete(mock_conn, 5, 2) is False
+
+
+@pytest.mark.asyncio
+async def test_update_title_uses_returning():
+    """Test title update success is read from RETURNING, not the status tag."""
+    mock_conn = AsyncMock()
+    mock_conn.fetchval = AsyncMock(side_effect=[1, None])
+
+    assert await ChatSession.update_title(mock_conn, 5, 1, "New") is True
+    assert await ChatSession.update_title(mock_conn, 6, 1, "New") is False
+    mock_conn.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_uses_returning():
+    """Test soft delete success is read from RETURNING, not the status tag."""
+    mock_conn = AsyncMock()
+    mock_conn.fetchval = AsyncMock(side_effect=[1, None])
+
+    assert await ChatSession.delete(mock_conn, 5, 1) is True
+    assert await ChatSession.delete(mock_conn, 6, 1) is False
+    mock_conn.execute.assert_not_called()
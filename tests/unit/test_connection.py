@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.db import connection
+
+
+@pytest.mark.asyncio
+async def test_get_pool_concurrent_callers_share_one_pool():
+    """Test concurrent first calls create the pool only once."""
+
+    async def slow_create_pool(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return AsyncMock()
+
+    with (
+        patch.object(connection, "_pool", None),
+        patch.object(connection.config, "DB_URL", "postgresql://test"),
+        patch.object(
+            connection.asyncpg, "create_pool", side_effect=slow_create_pool
+        ) as mock_create_pool,
+    ):
+        pools = await asyncio.gather(*(connection.get_pool() for _ in range(5)))
+
+    assert mock_create_pool.call_count == 1
+    assert all(pool is pools[0] for pool in pools)
+
+
+def _mock_pool(existing: int) -> MagicMock:
+    """Build a pool whose connection reports ``existing`` schema relations."""
+    mock_conn = MagicMock()
+    mock_conn.fetchval = AsyncMock(return_value=existing)
+    mock_conn.execute = AsyncMock()
+    mock_pool = MagicMock()
+    mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+    return mock_pool
+
+
+@pytest.mark.asyncio
+async def test_init_database_skips_ddl_on_warm_start():
+    """Test no DDL is sent when every schema relation already exists."""
+    mock_pool = _mock_pool(len(connection.SCHEMA_RELATIONS))
+
+    with patch.object(connection, "get_pool", AsyncMock(return_value=mock_pool)):
+        await connection.init_database()
+
+    mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+    mock_conn.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_init_database_applies_schema_when_missing():
+    """Test the schema DDL is sent when a relation is missing."""
+    mock_pool = _mock_pool(0)
+
+    with patch.object(connection, "get_pool", AsyncMock(return_value=mock_pool)):
+        await connection.init_database()
+
+    mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+    mock_conn.execute.assert_called_once_with(connection.SCHEMA_SQL)
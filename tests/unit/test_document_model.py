@@ -0,0 +1,33 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.db.models.document import DOCUMENT_COLUMNS, Document
+
+
+@pytest.mark.asyncio
+async def test_create_many_uses_copy():
+    """Test bulk creation sends all rows in a single COPY."""
+    mock_conn = AsyncMock()
+    rows = [
+        (1, "a.pdf", "public/1/1/a.pdf", "uri-a", "files/a", "application/pdf", 10),
+        (1, "b.txt", "public/1/1/b.txt", "uri-b", "files/b", "text/plain", 20),
+    ]
+
+    result = await Document.create_many(mock_conn, rows)
+
+    assert result == 2
+    mock_conn.copy_records_to_table.assert_called_once_with(
+        "documents", records=rows, columns=DOCUMENT_COLUMNS
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_many_empty():
+    """Test bulk creation with no rows does not touch the database."""
+    mock_conn = AsyncMock()
+
+    result = await Document.create_many(mock_conn, [])
+
+    assert result == 0
+    mock_conn.copy_records_to_table.assert_not_called()
@@ -0,0 +1,45 @@
+import pickle
+
+import pytest
+
+from src.exceptions import (
+    InvalidCredentialsError,
+    QueryError,
+    RAGAppError,
+    SessionNotFoundError,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
+
+
+def test_error_str_includes_details():
+    """Test the string form joins message and details."""
+    assert str(RAGAppError("Query failed", "timeout")) == "Query failed: timeout"
+    assert str(QueryError("Query failed")) == "Query failed"
+
+
+def test_error_pickle_keeps_slot_attributes():
+    """Test message and details survive pickling despite living in slots."""
+    error = pickle.loads(pickle.dumps(QueryError("Query failed", "timeout")))
+
+    assert isinstance(error, QueryError)
+    assert (error.message, error.details) == ("Query failed", "timeout")
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        InvalidCredentialsError(),
+        UserNotFoundError("alice"),
+        UserAlreadyExistsError("email", "alice@example.com"),
+        SessionNotFoundError(3),
+    ],
+)
+def test_error_pickle_with_custom_init(error):
+    """Test subclasses with their own __init__ signature round-trip intact."""
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert type(restored) is type(error)
+    assert restored.args == error.args
+    assert (restored.message, restored.details) == (error.message, error.details)
+    assert str(restored) == str(error)
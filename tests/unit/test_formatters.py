@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.formatters import format_response_with_citations
+
+
+def _response(text):
+    """Build a minimal stand-in for a Gemini response without citations."""
+    return SimpleNamespace(text=text, candidates=None)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("See (p. 3).", "See ([p. 3](/public/doc.pdf#page=3))."),
+        ("See (p.12-14).", "See ([p. 12-14](/public/doc.pdf#page=12))."),
+        ('"quoted", p. 7)', '"quoted", [p. 7](/public/doc.pdf#page=7))'),
+        ('"quoted",p. 7-9)', '"quoted", [p. 7-9](/public/doc.pdf#page=7))'),
+        (
+            'A (p. 1) and "b", p. 2) and (p. 3-4)',
+            "A ([p. 1](/public/doc.pdf#page=1)) and "
+            '"b", [p. 2](/public/doc.pdf#page=2)) and '
+            "([p. 3-4](/public/doc.pdf#page=3))",
+        ),
+        ("No citations here.", "No citations here."),
+    ],
+)
+def test_format_response_links_page_citations(text, expected):
+    """Test inline, standalone and range citations become page links."""
+    result = format_response_with_citations(_response(text), "doc.pdf")
+
+    assert result == expected
+
+
+def test_format_response_file_path_takes_precedence():
+    """Test citations link to file_path when both paths are given."""
+    result = format_response_with_citations(
+        _response("(p. 2)"), "doc.pdf", file_path="1/2/doc.pdf"
+    )
+
+    assert result == "([p. 2](/public/1/2/doc.pdf#page=2))"
+
+
+def test_format_response_without_source_leaves_text():
+    """Test citations are left untouched when no source document is given."""
+    assert format_response_with_citations(_response("(p. 2)")) == "(p. 2)"
@@ -0,0 +1,26 @@
+import logging
+import logging.handlers
+import time
+from unittest.mock import patch
+
+from src.utils.logger import setup_logger
+
+
+def test_setup_logger_writes_through_queue(tmp_path):
+    """Test log records are enqueued and written by the listener thread."""
+    with patch("src.utils.logger.config.LOGS_DIR", str(tmp_path)):
+        logger = setup_logger(
+            "gemini_rag.test_queue", log_file="queue.log", console_output=False
+        )
+
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+    logger.info("queued message")
+
+    # The listener thread writes asynchronously, so wait for the record
+    log_path = tmp_path / "queue.log"
+    deadline = time.monotonic() + 2
+    while "queued message" not in log_path.read_text(encoding="utf-8"):
+        assert time.monotonic() < deadline, "record was not written"
+        time.sleep(0.01)
@@ -0,0 +1,112 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.db.models.message import MESSAGE_COLUMNS, Message
+
+
+@pytest.mark.asyncio
+async def test_create_single_round_trip():
+    """Test message creation and session touch are sent as one statement."""
+    mock_conn = AsyncMock()
+    mock_conn.fetchval = AsyncMock(return_value=11)
+
+    result = await Message.create(mock_conn, 3, "user", "hello")
+
+    assert result == 11
+    mock_conn.fetchval.assert_called_once()
+    query = mock_conn.fetchval.call_args[0][0]
+    assert "INSERT INTO messages" in query
+    assert "UPDATE chat_sessions" in query
+    assert mock_conn.fetchval.call_args[0][1:] == (3, "user", "hello")
+    mock_conn.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_by_session_latest_page_oldest_first():
+    """Test the latest page is fetched newest first and returned oldest first."""
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(
+        return_value=[{"id": 2, "content": "b"}, {"id": 1, "content": "a"}]
+    )
+
+    result = await Message.list_by_session(mock_conn, 3, limit=2)
+
+    assert [m["id"] for m in result] == [1, 2]
+    assert mock_conn.fetch.call_args[0][1:] == (3, None, None, 2)
+
+
+@pytest.mark.asyncio
+async def test_list_by_session_with_cursor():
+    """Test an older page is requested with the ``before`` cursor."""
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[])
+    created_at = datetime(2025, 1, 1, 12, 0)
+
+    result = await Message.list_by_session(mock_conn, 3, before=(created_at, 9))
+
+    assert result == []
+    assert mock_conn.fetch.call_args[0][1:] == (3, created_at, 9, 200)
+
+
+@pytest.mark.asyncio
+async def test_list_by_session_pages_through_shared_timestamp():
+    """Test messages of one batch, sharing created_at, span pages intact."""
+    created_at = datetime(2025, 1, 1, 12, 0)
+    rows = [{"id": i, "created_at": created_at} for i in range(1, 6)]
+
+    async def fetch(query, chat_session_id, before_created_at, before_id, limit):
+        # Mirror the query's row-value keyset and newest-first ordering
+        older = [
+            r
+            for r in rows
+            if before_created_at is None
+            or (r["created_at"], r["id"]) < (before_created_at, before_id)
+        ]
+        older.sort(key=lambda r: (r["created_at"], r["id"]), reverse=True)
+        return older[:limit]
+
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(side_effect=fetch)
+
+    seen = []
+    page = await Message.list_by_session(mock_conn, 3, limit=2)
+    while page:
+        seen = [m["id"] for m in page] + seen
+        first = page[0]
+        page = await Message.list_by_session(
+            mock_conn, 3, before=(first["created_at"], first["id"]), limit=2
+        )
+
+    assert seen == [1, 2, 3, 4, 5]
+    query = " ".join(mock_conn.fetch.call_args[0][0].upper().split())
+    assert "(CREATED_AT, ID) < ($2, $3)" in query
+    assert "ORDER BY CREATED_AT DESC, ID DESC" in query
+
+
+@pytest.mark.asyncio
+async def test_create_many_copies_and_touches_sessions():
+    """Test bulk creation sends one COPY and touches each session once."""
+    mock_conn = MagicMock()
+    mock_conn.copy_records_to_table = AsyncMock()
+    mock_conn.execute = AsyncMock()
+    rows = [(3, "user", "hi"), (3, "assistant", "hello"), (4, "user", "hey")]
+
+    result = await Message.create_many(mock_conn, rows)
+
+    assert result == 3
+    mock_conn.transaction.assert_called_once()
+    mock_conn.copy_records_to_table.assert_called_once_with(
+        "messages", records=rows, columns=MESSAGE_COLUMNS
+    )
+    assert sorted(mock_conn.execute.call_args[0][1]) == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_create_many_empty():
+    """Test bulk creation with no rows does not touch the database."""
+    mock_conn = AsyncMock()
+
+    assert await Message.create_many(mock_conn, []) == 0
+    mock_conn.copy_records_to_table.assert_not_called()
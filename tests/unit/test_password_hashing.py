@@ -0,0 +1,63 @@
+import hashlib
+import ssl
+
+from src.db.models.base import hash_password, needs_rehash, verify_password
+
+
+def test_hash_password_roundtrip():
+    """Test a hashed password verifies with the same password."""
+    password_hash = hash_password("correct horse")
+
+    assert verify_password("correct horse", password_hash) is True
+
+
+def test_verify_password_wrong_password():
+    """Test a different password is rejected."""
+    password_hash = hash_password("correct horse")
+
+    assert verify_password("battery staple", password_hash) is False
+
+
+def test_hash_password_uses_random_salt():
+    """Test hashing the same password twice gives different hashes."""
+    assert hash_password("secret") != hash_password("secret")
+
+
+def test_verify_password_malformed_hash():
+    """Test a stored hash without a salt separator is rejected."""
+    assert verify_password("secret", "not-a-valid-hash") is False
+
+
+def test_hash_password_uses_argon2id():
+    """Test new hashes are stored in the Argon2id PHC format."""
+    password_hash = hash_password("secret")
+
+    assert password_hash.startswith("$argon2id$")
+    assert len(password_hash) <= 255  # fits users.password_hash
+
+
+def test_verify_password_legacy_sha256():
+    """Test hashes in the legacy SHA-256 'salt$hash' format still verify."""
+    salt = "00112233445566778899aabbccddeeff"
+    legacy_hash = f"{salt}${hashlib.sha256(('secret' + salt).encode()).hexdigest()}"
+
+    assert verify_password("secret", legacy_hash) is True
+    assert verify_password("wrong", legacy_hash) is False
+    assert needs_rehash(legacy_hash) is True
+
+
+def test_needs_rehash_current_argon2id():
+    """Test a hash made with the current parameters needs no rehash."""
+    assert needs_rehash(hash_password("secret")) is False
+
+
+def test_verify_password_malformed_argon2_hash():
+    """Test a corrupt Argon2 hash is rejected instead of raising."""
+    assert verify_password("secret", "$argon2id$garbage") is False
+
+
+def test_openssl_supports_accelerated_digests():
+    """Test SHA-256 is computed by OpenSSL 3.0+, which uses SHA-NI if present."""
+    assert ssl.OPENSSL_VERSION_INFO >= (3, 0)
+    # The builtin fallback would be named plain "sha256"
+    assert hashlib.sha256.__name__ == "openssl_sha256"
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from google.genai import types
+
+from src.core import rag_manager
+
+
+@pytest.fixture(autouse=True)
+def empty_upload_cache():
+    """Start and end every test with an empty upload cache."""
+    rag_manager._upload_cache.clear()
+    yield
+    rag_manager._upload_cache.clear()
+
+
+def _file(name: str, expires_in: timedelta = timedelta(hours=48)) -> types.File:
+    """Build an uploaded file reference expiring ``expires_in`` from now."""
+    return types.File(
+        name=name, expiration_time=datetime.now(timezone.utc) + expires_in
+    )
+
+
+def test_cached_upload_is_returned():
+    """Test a cached upload is returned for its digest."""
+    file = _file("files/a")
+    rag_manager._cache_upload("digest-a", file)
+
+    assert rag_manager._get_cached_upload("digest-a") is file
+    assert rag_manager._get_cached_upload("digest-b") is None
+
+
+def test_cached_upload_expiring_within_margin_is_evicted():
+    """Test uploads that expire within the safety margin are not reused."""
+    margin = rag_manager._UPLOAD_CACHE_EXPIRY_MARGIN
+    rag_manager._cache_upload("digest-a", _file("files/a", margin / 2))
+
+    assert rag_manager._get_cached_upload("digest-a") is None
+    assert "digest-a" not in rag_manager._upload_cache
+
+
+def test_cache_upload_evicts_least_recently_used():
+    """Test the least recently used upload is evicted when the cache is full."""
+    with patch.object(rag_manager, "_UPLOAD_CACHE_SIZE", 2):
+        rag_manager._cache_upload("digest-a", _file("files/a"))
+        rag_manager._cache_upload("digest-b", _file("files/b"))
+        # Reading an entry marks it as recently used
+        rag_manager._get_cached_upload("digest-a")
+        rag_manager._cache_upload("digest-c", _file("files/c"))
+
+    assert list(rag_manager._upload_cache) == ["digest-a", "digest-c"]
+
+
+@pytest.mark.asyncio
+async def test_wait_one_forgets_upload_when_lookup_fails():
+    """Test a failed status lookup, e.g. a 404, drops the cached upload."""
+    file = _file("files/a")
+    rag_manager._cache_upload("digest-a", file)
+
+    with patch.object(
+        rag_manager.client.files, "get", side_effect=RuntimeError("404 Not Found")
+    ):
+        with pytest.raises(RuntimeError):
+            await rag_manager._wait_one(file)
+
+    assert rag_manager._get_cached_upload("digest-a") is None
+
+
+@pytest.mark.asyncio
+async def test_wait_one_forgets_upload_when_processing_fails():
+    """Test a file that ends in the FAILED state drops the cached upload."""
+    file = _file("files/a")
+    rag_manager._cache_upload("digest-a", file)
+
+    with patch.object(
+        rag_manager.client.files,
+        "get",
+        return_value=types.File(name="files/a", state=types.FileState.FAILED),
+    ):
+        with pytest.raises(Exception, match="failed to process"):
+            await rag_manager._wait_one(file)
+
+    assert rag_manager._get_cached_upload("digest-a") is None
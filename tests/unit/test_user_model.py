@@ -1,7 +1,11 @@
-from unittest.mock import AsyncMock
+import asyncio
+import hashlib
+import threading
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.db.models import user as user_module
 from src.db.models.user import User
 
 
@@ -86,3 +90,167 @@ async def test_update_password_hashes_password():
     assert "$" in password_hash
     # Should NOT be the plaintext password
     assert password_hash != "mypassword"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_copies_hashed_rows():
+    """Test bulk creation hashes passwords and sends one COPY."""
+    mock_conn = AsyncMock()
+    users = [("alice", "alice@example.com", "pw1"), ("bob", "bob@example.com", "pw2")]
+
+    result = await User.bulk_create(mock_conn, users)
+
+    assert result == 2
+    mock_conn.copy_records_to_table.assert_called_once()
+    records = mock_conn.copy_records_to_table.call_args.kwargs["records"]
+    assert [r[:2] for r in records] == [
+        ("alice", "alice@example.com"),
+        ("bob", "bob@example.com"),
+    ]
+    # Passwords must be hashed, never stored in plain text
+    assert all("$" in r[2] and r[2] not in ("pw1", "pw2") for r in records)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_rehashes_legacy_hash():
+    """Test a successful login with an outdated hash stores an Argon2id hash."""
+    salt = "00112233445566778899aabbccddeeff"
+    legacy_hash = f"{salt}${hashlib.sha256(('secret' + salt).encode()).hexdigest()}"
+    mock_conn = AsyncMock()
+    mock_conn.fetchrow = AsyncMock(
+        return_value={
+            "id": 7,
+            "username": "alice",
+            "email": "alice@example.com",
+            "password_hash": legacy_hash,
+        }
+    )
+    mock_pool = AsyncMock()
+
+    with (
+        patch("src.db.models.user.get_pool", AsyncMock(return_value=mock_pool)),
+        patch("src.db.models.user._LAST_LOGIN_FLUSH_DELAY", 0),
+    ):
+        result = await User.authenticate(mock_conn, "alice", "secret")
+        await asyncio.gather(*user_module._background_tasks)
+
+    assert result == {"id": 7, "username": "alice", "email": "alice@example.com"}
+    rehashes = [c.args for c in mock_pool.execute.call_args_list if len(c.args) == 4]
+    assert len(rehashes) == 1
+    _, stored_hash, user_id, expected_hash = rehashes[0]
+    assert stored_hash.startswith("$argon2id$")
+    # Only swapped in if the verified hash is still the stored one
+    assert (user_id, expected_hash) == (7, legacy_hash)
+    assert "password_hash = $3" in rehashes[0][0]
+
+
+@pytest.mark.asyncio
+async def test_authenticate_verifies_off_event_loop():
+    """Test password verification runs on the dedicated password executor."""
+    mock_conn = AsyncMock()
+    mock_conn.fetchrow = AsyncMock(
+        return_value={
+            "id": 7,
+            "username": "alice",
+            "email": "alice@example.com",
+            "password_hash": "stored-hash",
+        }
+    )
+    verify_threads = []
+
+    def fake_verify(password, password_hash):
+        verify_threads.append(threading.current_thread().name)
+        return False
+
+    with patch("src.db.models.user.verify_password", fake_verify):
+        result = await User.authenticate(mock_conn, "alice", "wrong")
+
+    assert result is None
+    assert verify_threads and verify_threads[0].startswith("password")
+
+
+@pytest.mark.asyncio
+async def test_authenticate_unknown_user_still_verifies():
+    """Test a missing user costs a verification, like a wrong password."""
+    mock_conn = AsyncMock()
+    mock_conn.fetchrow = AsyncMock(return_value=None)
+    verified_hashes = []
+    verify_threads = []
+
+    def fake_verify(password, password_hash):
+        verified_hashes.append(password_hash)
+        verify_threads.append(threading.current_thread().name)
+        return False
+
+    with patch("src.db.models.user.verify_password", fake_verify):
+        result = await User.authenticate(mock_conn, "nobody", "secret")
+
+    assert result is None
+    assert verified_hashes == [user_module._DUMMY_HASH]
+    assert verify_threads[0].startswith("password")
+    assert user_module._DUMMY_HASH.startswith("$argon2id$")
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_cached_until_password_update():
+    """Test get_by_id is served from cache until the user is updated."""
+    user_module._user_cache.clear()
+    mock_conn = AsyncMock()
+    mock_conn.fetchrow = AsyncMock(
+        return_value={"id": 5, "username": "bob", "email": "bob@example.com"}
+    )
+
+    first = await User.get_by_id(mock_conn, 5)
+    second = await User.get_by_id(mock_conn, 5)
+
+    assert first == second == {"id": 5, "username": "bob", "email": "bob@example.com"}
+    assert mock_conn.fetchrow.call_count == 1
+
+    mock_conn.execute = AsyncMock(return_value="UPDATE 1")
+    await User.update_password(mock_conn, "bob", "newpass")
+    await User.get_by_id(mock_conn, 5)
+
+    # lookup by id, lookup by login, then a fresh lookup by id
+    assert mock_conn.fetchrow.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_last_login_updates_are_coalesced():
+    """Test logins within the flush delay share a single UPDATE."""
+    mock_pool = AsyncMock()
+
+    with (
+        patch("src.db.models.user.get_pool", AsyncMock(return_value=mock_pool)),
+        patch("src.db.models.user._LAST_LOGIN_FLUSH_DELAY", 0),
+    ):
+        for user_id in (1, 2, 1):
+            user_module._record_login(user_id)
+        await asyncio.gather(*user_module._background_tasks)
+
+    mock_pool.execute.assert_called_once()
+    assert sorted(mock_pool.execute.call_args[0][1]) == [1, 2]
+    assert user_module._last_login_flush is None
+
+
+@pytest.mark.asyncio
+async def test_last_login_flush_rescheduled_after_cancel():
+    """Test a cancelled flush does not stop later logins from being stamped."""
+    mock_pool = AsyncMock()
+
+    with patch("src.db.models.user._LAST_LOGIN_FLUSH_DELAY", 60):
+        user_module._record_login(1)
+    stale_flush = user_module._last_login_flush
+    stale_flush.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stale_flush
+
+    with (
+        patch("src.db.models.user.get_pool", AsyncMock(return_value=mock_pool)),
+        patch("src.db.models.user._LAST_LOGIN_FLUSH_DELAY", 0),
+    ):
+        user_module._record_login(2)
+        await asyncio.gather(*user_module._background_tasks)
+
+    mock_pool.execute.assert_called_once()
+    assert sorted(mock_pool.execute.call_args[0][1]) == [1, 2]
+    assert not user_module._pending_logins